@@ -4,14 +4,20 @@ OpenAPI proxy server for Renshuu API.
 Serves the OpenAPI spec and proxies requests to the Renshuu API with authentication.
 """
 
+import asyncio
+import contextlib
 import os
+import socket
 import httpx
 from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.routing import Route, Mount
-from starlette.responses import JSONResponse, FileResponse
+from starlette.responses import JSONResponse, FileResponse, StreamingResponse
 from starlette.requests import Request
+from starlette.background import BackgroundTask
 import uvicorn
-import json
+import orjson
 from src.client import RenshuuClient
 
 # Load API key from environment
@@ -21,6 +27,64 @@ if not API_KEY:
 
 RENSHUU_BASE_URL = "https://api.renshuu.org/v1"
 
+# Invariant headers for proxied requests, built once at startup
+AUTH_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+}
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of stdlib json."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+RENSHUU_HOST = "api.renshuu.org"
+DNS_REFRESH_INTERVAL = 60.0
+
+
+async def _refresh_dns() -> None:
+    """Periodically re-resolve the Renshuu origin to keep the resolver cache warm."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.getaddrinfo(RENSHUU_HOST, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+        await asyncio.sleep(DNS_REFRESH_INTERVAL)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    """Create one shared HTTP client (and RenshuuClient) for the server's lifetime."""
+    # Resolve the origin once up front so the first connections skip the DNS
+    # round trip, then keep the cache warm in the background
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(OSError):
+        await loop.getaddrinfo(RENSHUU_HOST, 443, type=socket.SOCK_STREAM)
+    dns_task = asyncio.create_task(_refresh_dns())
+
+    app.state.http = httpx.AsyncClient(
+        base_url=RENSHUU_BASE_URL,
+        headers={
+            "Authorization": f"Bearer {API_KEY}",
+            "Accept-Encoding": "gzip, br",
+        },
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=RenshuuClient.LIMITS,
+            retries=1
+        )
+    )
+    app.state.renshuu = RenshuuClient(API_KEY, http_client=app.state.http) if API_KEY else None
+    try:
+        yield
+    finally:
+        dns_task.cancel()
+        await app.state.http.aclose()
+
 
 async def serve_openapi_spec(request: Request):
     """Serve the OpenAPI specification."""
@@ -30,31 +94,38 @@ async def serve_openapi_spec(request: Request):
 async def add_word_by_schedule_name_handler(request: Request):
     """Handle the convenience endpoint for adding a word by schedule name."""
     try:
-        body = await request.json()
+        raw = await request.body()
+        body = orjson.loads(raw) if raw else {}
         schedule_name = body.get("schedule_name")
         word = body.get("word")
         
         if not schedule_name or not word:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"ok": False, "error": "Missing schedule_name or word"},
                 status_code=400
             )
         
-        async with RenshuuClient(API_KEY) as client:
-            result = await client.add_word_by_schedule_name(schedule_name, word)
-            
-            if "error" in result:
-                return JSONResponse(
-                    {"ok": False, "status": 400, "data": result},
-                    status_code=400
-                )
-            
-            return JSONResponse(
-                {"ok": True, "status": 200, "data": result},
-                status_code=200
+        client = request.app.state.renshuu
+        if client is None:
+            return ORJSONResponse(
+                {"ok": False, "error": "No API key configured"},
+                status_code=500
+            )
+
+        result = await client.add_word_by_schedule_name(schedule_name, word)
+
+        if "error" in result:
+            return ORJSONResponse(
+                {"ok": False, "status": 400, "data": result},
+                status_code=400
             )
+
+        return ORJSONResponse(
+            {"ok": True, "status": 200, "data": result},
+            status_code=200
+        )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             {"ok": False, "error": str(e)},
             status_code=500
         )
@@ -63,76 +134,89 @@ async def add_word_by_schedule_name_handler(request: Request):
 async def add_word_by_list_name_handler(request: Request):
     """Handle the convenience endpoint for adding a word by list name."""
     try:
-        body = await request.json()
+        raw = await request.body()
+        body = orjson.loads(raw) if raw else {}
         list_name = body.get("list_name")
         word = body.get("word")
         
         if not list_name or not word:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"ok": False, "error": "Missing list_name or word"},
                 status_code=400
             )
         
-        async with RenshuuClient(API_KEY) as client:
-            result = await client.add_word_by_list_name(list_name, word)
-            
-            if "error" in result:
-                return JSONResponse(
-                    {"ok": False, "status": 400, "data": result},
-                    status_code=400
-                )
-            
-            return JSONResponse(
-                {"ok": True, "status": 200, "data": result},
-                status_code=200
+        client = request.app.state.renshuu
+        if client is None:
+            return ORJSONResponse(
+                {"ok": False, "error": "No API key configured"},
+                status_code=500
+            )
+
+        result = await client.add_word_by_list_name(list_name, word)
+
+        if "error" in result:
+            return ORJSONResponse(
+                {"ok": False, "status": 400, "data": result},
+                status_code=400
             )
+
+        return ORJSONResponse(
+            {"ok": True, "status": 200, "data": result},
+            status_code=200
+        )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             {"ok": False, "error": str(e)},
             status_code=500
         )
 
 
-from starlette.responses import JSONResponse
-
 async def proxy_request(request: Request):
-    path = request.url.path.replace("/api/v1", "")
-    target_url = f"{RENSHUU_BASE_URL}{path}"
+    # removeprefix only strips the mount point, unlike replace which would
+    # also rewrite /api/v1 appearing deeper in the path
+    path = request.scope["path"].removeprefix("/api/v1")
 
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-
-        params = dict(request.query_params)
-        body = await request.body()
-
-        if request.method == "GET":
-            response = await client.get(target_url, headers=headers, params=params)
-        elif request.method == "POST":
-            response = await client.post(target_url, headers=headers, params=params, content=body)
-        elif request.method == "PUT":
-            response = await client.put(target_url, headers=headers, params=params, content=body)
-        elif request.method == "DELETE":
-            response = await client.delete(target_url, headers=headers, params=params)
-        else:
-            return JSONResponse({"ok": False, "error": "Method not allowed"}, status_code=405)
+    client = request.app.state.http
 
-        try:
-            payload = {
-                "ok": response.status_code < 400,
-                "status": response.status_code,
-                "data": response.json()
-            }
-        except Exception:
-            payload = {
-                "ok": response.status_code < 400,
-                "status": response.status_code,
-                "raw": response.text
-            }
-
-        return JSONResponse(payload, status_code=response.status_code)
+    if request.method not in ("GET", "POST", "PUT", "DELETE"):
+        return ORJSONResponse({"ok": False, "error": "Method not allowed"}, status_code=405)
+
+    params = dict(request.query_params)
+
+    headers = dict(AUTH_HEADERS)
+
+    # Let upstream negotiate compression with the caller's preferences; a
+    # caller that advertises nothing must get identity, not the shared
+    # client's default gzip/br
+    headers["Accept-Encoding"] = request.headers.get("accept-encoding", "identity")
+
+    # Forward the inbound body as an async stream rather than buffering it;
+    # Content-Type/Content-Length only apply to methods that carry a body
+    content = None
+    if request.method in ("POST", "PUT"):
+        content = request.stream()
+        headers["Content-Type"] = request.headers.get("content-type", "application/json")
+        if "content-length" in request.headers:
+            headers["Content-Length"] = request.headers["content-length"]
+
+    upstream = client.build_request(request.method, path, headers=headers, params=params, content=content)
+
+    # Stream the upstream bytes straight through instead of parsing and
+    # re-serializing the JSON body
+    response = await client.send(upstream, stream=True)
+
+    response_headers = {
+        "content-type": response.headers.get("content-type", "application/json")
+    }
+    if "content-encoding" in response.headers:
+        response_headers["content-encoding"] = response.headers["content-encoding"]
+
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=response_headers,
+        background=BackgroundTask(response.aclose)
+    )
 
 app = Starlette(
     routes=[
@@ -143,7 +227,9 @@ app = Starlette(
         Mount("/api/v1", routes=[
             Route("/{path:path}", proxy_request, methods=["GET", "POST", "PUT", "DELETE"])
         ])
-    ]
+    ],
+    middleware=[Middleware(GZipMiddleware, minimum_size=512)],
+    lifespan=lifespan
 )
 
 
@@ -159,4 +245,14 @@ if __name__ == "__main__":
     else:
         print("WARNING: No API key configured!")
     
-    uvicorn.run(app, host=host, port=port)
+    # Import-string form so uvicorn can re-import the app in each worker;
+    # every worker gets its own lifespan-owned HTTP client
+    uvicorn.run(
+        "run_openapi_server:app",
+        host=host,
+        port=port,
+        workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
@@ -1,5 +1,12 @@
 import asyncio
 from src import main
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # uvloop is unavailable on Windows; fall back to the stdlib loop
+    pass
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
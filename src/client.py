@@ -1,57 +1,124 @@
+import asyncio
+import itertools
 import os
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 import httpx
 
+__all__ = ["RenshuuClient"]
+
+# Resolved once at import so each client construction skips the env lookups
+_DEFAULT_API_KEY = os.getenv("RENSHUU_WRITE_KEY") or os.getenv("RENSHUU_READ_KEY")
+
+
 class RenshuuClient:
     BASE_URL = "https://api.renshuu.org/v1"
-    
-    def __init__(self, api_key: Optional[str] = None):
+    LIMITS = httpx.Limits(
+        max_connections=int(os.getenv("RENSHUU_MAX_CONN", "1000")),
+        max_keepalive_connections=int(os.getenv("RENSHUU_MAX_KEEPALIVE", "100")),
+        keepalive_expiry=60.0
+    )
+    NAME_INDEX_TTL = 300.0
+    WORD_CACHE_TTL = 60.0
+    WORD_CACHE_SIZE = 256
+    # Read-heavy listings worth revalidating with ETags; caching every GET
+    # (e.g. each distinct search query) would grow memory without bound
+    ETAG_CACHED_ENDPOINTS = frozenset({"/schedule", "/lists"})
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the client with the user's renshuu API key.
-        
+
         :param api_key: Renshuu API key. Falls back to RENSHUU_WRITE_KEY, then RENSHUU_READ_KEY.
         :type api_key: Optional[str]
+        :param http_client: Externally managed httpx.AsyncClient to reuse. When given,
+            the caller owns its lifecycle and no `async with` entry is needed.
+        :type http_client: Optional[httpx.AsyncClient]
         """
-        self.api_key = api_key or os.getenv("RENSHUU_WRITE_KEY") or os.getenv("RENSHUU_READ_KEY")
+        self.api_key = api_key or _DEFAULT_API_KEY
         if not self.api_key:
             raise ValueError(
                 "API key not found. Set RENSHUU_WRITE_KEY or RENSHUU_READ_KEY, or pass it as a parameter."
             )
-        
-        self._client: Optional[httpx.AsyncClient] = None
+
+        self._client: Optional[httpx.AsyncClient] = http_client
+        self._owns_client = http_client is None
+
+        # Lazily built name -> (id, original name) lookup tables for the
+        # convenience methods, refreshed after NAME_INDEX_TTL seconds.
+        self._schedule_name_index: dict[str, tuple[str, str]] = {}
+        self._schedule_index_ts: float = 0.0
+        self._list_name_index: dict[str, tuple[str, str]] = {}
+        self._list_index_ts: float = 0.0
+
+        # ETag cache for conditional GETs: (endpoint, params) -> (etag, body)
+        self._etag_cache: dict[tuple, tuple[str, dict[str, Any]]] = {}
+
+        # Small LRU of first-page word searches for the convenience methods
+        self._word_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
 
     @property
     def headers(self) -> dict[str, str]:
         """Authorization headers for requests."""
-        return {"Authorization": f"Bearer {self.api_key}"}
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept-Encoding": "gzip, br",
+        }
     
     async def __aenter__(self) -> "RenshuuClient":
-        """Create async HTTP client"""
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers=self.headers,
-            timeout=30
-        )
+        """Create async HTTP client, unless one was injected"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                headers=self.headers,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                http2=True,
+                limits=self.LIMITS
+            )
+            self._owns_client = True
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Close async HTTP client"""
-        if self._client:
+        """Close async HTTP client if this instance created it"""
+        if self._client and self._owns_client:
             await self._client.aclose()
     
     async def _request(
         self,
         method: str,
         endpoint: str,
-        params: Optional[dict] = None
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None
     ) -> dict[str, Any]:
-        """Make HTTP request to renshuu"""
+        """Make HTTP request to renshuu, revalidating cached GETs via ETags."""
         if not self._client:
             raise RuntimeError("HTTP client not initialized.")
-        
-        response = await self._client.request(method, endpoint, params=params)
+
+        cache_key = None
+        cached = None
+        if method == "GET" and endpoint in self.ETAG_CACHED_ENDPOINTS:
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                headers = dict(headers or {})
+                headers["If-None-Match"] = cached[0]
+
+        response = await self._client.request(method, endpoint, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        if cache_key is not None:
+            etag = response.headers.get("etag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, data)
+        return data
     
     async def get_profile(self) -> dict[str, Any]:
         """Get the user's profile information."""
@@ -85,6 +152,28 @@ class RenshuuClient:
     ) -> dict[str, Any]:
         """Get terms in a schedule."""
         return await self._request("GET", f"/schedule/{schedule_id}/list", params={"pg": pg, "group": group})
+
+    async def get_all_schedule_terms(self, schedule_id: str, group: str = "all") -> dict[str, Any]:
+        """Get every page of terms in a schedule, fetching pages 2..N concurrently."""
+        first = await self.get_schedule_terms(schedule_id, pg=1, group=group)
+        contents = first.get("contents", {})
+        total_pages = int(contents.get("total_pg", 1) or 1)
+        if total_pages <= 1:
+            return first
+
+        remaining = await asyncio.gather(*(
+            self.get_schedule_terms(schedule_id, pg=pg, group=group)
+            for pg in range(2, total_pages + 1)
+        ))
+        # Merge into a fresh dict: _request may hand back the ETag cache's
+        # stored body, which must never be mutated
+        terms = list(contents.get("terms", []))
+        for page in remaining:
+            terms.extend(page.get("contents", {}).get("terms", []))
+        return {
+            **first,
+            "contents": {**contents, "terms": terms, "result_count": len(terms)}
+        }
     
     # ====== word ======
 
@@ -112,6 +201,57 @@ class RenshuuClient:
         """Remove a word from a schedule."""
         return await self._request("DELETE", f"/word/{word_id}", params={"sched_id": schedule_id})
 
+    async def _schedule_index(self, force: bool = False) -> dict[str, tuple[str, str]]:
+        """Return the schedule name index, rebuilding it when stale or forced."""
+        fresh = time.monotonic() - self._schedule_index_ts < self.NAME_INDEX_TTL
+        if self._schedule_name_index and fresh and not force:
+            return self._schedule_name_index
+
+        schedules_response = await self.get_schedules()
+        self._schedule_name_index = {
+            s.get("name", "").casefold(): (str(s.get("id")), s.get("name"))
+            for s in schedules_response.get("schedules", [])
+        }
+        self._schedule_index_ts = time.monotonic()
+        return self._schedule_name_index
+
+    async def _list_index(self, force: bool = False) -> dict[str, tuple[str, str]]:
+        """Return the list name index, rebuilding it when stale or forced."""
+        fresh = time.monotonic() - self._list_index_ts < self.NAME_INDEX_TTL
+        if self._list_name_index and fresh and not force:
+            return self._list_name_index
+
+        lists_response = await self.get_lists()
+        all_lists = itertools.chain.from_iterable(
+            subgroup.get("lists", ())
+            for group in lists_response.get("termtype_groups", ())
+            for subgroup in group.get("groups", ())
+        )
+        self._list_name_index = {
+            lst.get("title", "").casefold(): (str(lst.get("list_id")), lst.get("title"))
+            for lst in all_lists
+        }
+        self._list_index_ts = time.monotonic()
+        return self._list_name_index
+
+    async def _cached_search_words(self, word: str) -> dict[str, Any]:
+        """First-page word search with a short-TTL LRU cache.
+
+        The same word is often added to several schedules or lists in one
+        session; repeats within WORD_CACHE_TTL skip the upstream search.
+        """
+        cached = self._word_cache.get(word)
+        if cached and time.monotonic() - cached[0] < self.WORD_CACHE_TTL:
+            self._word_cache.move_to_end(word)
+            return cached[1]
+
+        result = await self.search_words(word, pg=1)
+        self._word_cache[word] = (time.monotonic(), result)
+        self._word_cache.move_to_end(word)
+        while len(self._word_cache) > self.WORD_CACHE_SIZE:
+            self._word_cache.popitem(last=False)
+        return result
+
     async def add_word_by_schedule_name(
         self,
         schedule_name: str,
@@ -120,32 +260,32 @@ class RenshuuClient:
         """
         Add a word to a schedule by schedule name.
         Combines schedule lookup and word addition in a single operation.
-        
+
         :param schedule_name: Name of the schedule
         :param word: Word to search for and add (Japanese or English)
         :return: Result of the operation
         """
-        # First, get all schedules to find the matching one
-        schedules_response = await self.get_schedules()
-        schedules = schedules_response.get("schedules", [])
-        
-        # Find schedule by name (case-insensitive)
-        matching_schedule = None
-        for schedule in schedules:
-            if schedule.get("name", "").lower() == schedule_name.lower():
-                matching_schedule = schedule
-                break
-        
+        # Resolve the schedule name and search for the word concurrently;
+        # the index is a cached dict lookup on the warm path
+        index, word_search_response = await asyncio.gather(
+            self._schedule_index(),
+            self._cached_search_words(word)
+        )
+
+        matching_schedule = index.get(schedule_name.casefold())
+        if not matching_schedule:
+            # The cached index may predate a newly created schedule; rebuild once
+            index = await self._schedule_index(force=True)
+            matching_schedule = index.get(schedule_name.casefold())
+
         if not matching_schedule:
             return {
                 "error": f"Schedule '{schedule_name}' not found",
-                "available_schedules": [s.get("name") for s in schedules]
+                "available_schedules": [name for _, name in index.values()]
             }
-        
-        schedule_id = str(matching_schedule.get("id"))
-        
-        # Search for the word
-        word_search_response = await self.search_words(word, pg=1)
+
+        schedule_id, schedule_title = matching_schedule
+
         words = word_search_response.get("words", [])
         
         if not words:
@@ -165,7 +305,7 @@ class RenshuuClient:
             "success": True,
             "schedule": {
                 "id": schedule_id,
-                "name": matching_schedule.get("name")
+                "name": schedule_title
             },
             "word": {
                 "id": word_id,
@@ -189,35 +329,27 @@ class RenshuuClient:
         :param word: Word to search for and add (Japanese or English)
         :return: Result of the operation
         """
-        # First, get all lists to find the matching one
-        lists_response = await self.get_lists()
-        
-        # Extract all lists from the nested structure
-        all_lists = []
-        termtype_groups = lists_response.get("termtype_groups", [])
-        for group in termtype_groups:
-            groups = group.get("groups", [])
-            for subgroup in groups:
-                lists = subgroup.get("lists", [])
-                all_lists.extend(lists)
-        
-        # Find list by name (case-insensitive)
-        matching_list = None
-        for lst in all_lists:
-            if lst.get("title", "").lower() == list_name.lower():
-                matching_list = lst
-                break
-        
+        # Resolve the list name and search for the word concurrently;
+        # the index is a cached dict lookup on the warm path
+        index, word_search_response = await asyncio.gather(
+            self._list_index(),
+            self._cached_search_words(word)
+        )
+
+        matching_list = index.get(list_name.casefold())
+        if not matching_list:
+            # The cached index may predate a newly created list; rebuild once
+            index = await self._list_index(force=True)
+            matching_list = index.get(list_name.casefold())
+
         if not matching_list:
             return {
                 "error": f"List '{list_name}' not found",
-                "available_lists": [lst.get("title") for lst in all_lists]
+                "available_lists": [title for _, title in index.values()]
             }
-        
-        list_id = str(matching_list.get("list_id"))
-        
-        # Search for the word
-        word_search_response = await self.search_words(word, pg=1)
+
+        list_id, list_title = matching_list
+
         words = word_search_response.get("words", [])
         
         if not words:
@@ -237,7 +369,7 @@ class RenshuuClient:
             "success": True,
             "list": {
                 "id": list_id,
-                "name": matching_list.get("title")
+                "name": list_title
             },
             "word": {
                 "id": word_id,
@@ -1,661 +1,697 @@
-import json
 import logging
+import logging.handlers
+import queue
 import asyncio
-from typing import Any
+import sys
+import time
+import orjson
+from typing import Any, Awaitable, Callable
+from jsonschema import Draft7Validator, ValidationError
 from mcp.types import Tool, TextContent
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from .client import RenshuuClient
 
-logging.basicConfig(level=logging.INFO)
+# Log records go through a queue so handler I/O (stderr writes) never blocks
+# the event loop; main() attaches the QueueHandler and runs the QueueListener
+# that drains it, so merely importing this module has no logging side effects
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
 logger = logging.getLogger("renshuu-mcp-logger")
 
 server = Server("renshuu-mcp")
 
-client: RenshuuClient | None = None
-
 def _format_response(data: Any) -> list[TextContent]:
     """Format renshuu API response as MCP TextContent."""
-    return [TextContent(type="text", text=json.dumps(data, indent=2, ensure_ascii=False))]
+    # orjson always emits UTF-8, matching the previous ensure_ascii=False output
+    return [TextContent(type="text", text=orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())]
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """
-    Endpoint that provides the list of tools for the MCP client.
-    """
-    return [
-        Tool(
-            name="get_profile",
-            description="Get the current user's Renshuu profile including study statistics, streaks, and level progress.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_schedules",
-            description="Get all of the user's study schedules. Returns schedule names, IDs, and study counts.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_schedule",
-            description="Get details of a specific schedule by ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    }
-                },
-                "required": ["schedule_id"]
-            }
-        ),
-        Tool(
-            name="get_schedule_terms",
-            description="Get the terms (vocabulary, kanji, etc.) in a specific schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "Page number (default: 1)",
-                        "default": 1
-                    },
-                    "group": {
-                        "type": "string",
-                        "description": "Filter group: all, studied, notyetstudied, review_today, etc.",
-                        "default": "all"
-                    }
-                },
-                "required": ["schedule_id"]
-            }
-        ),
-        Tool(
-            name="get_lists",
-            description="Get all user-created vocabulary/kanji/grammar lists.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_list",
-            description="Get contents of a specific user list by ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID"
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "Page number (default: 1)",
-                        "default": 1
-                    }
-                },
-                "required": ["list_id"]
-            }
-        ),
-        Tool(
-            name="get_all_studied_terms",
-            description="Get all terms of a specified type (vocab, grammar, kanji, sent) that the user has studied.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "termtype": {
-                        "type": "string",
-                        "description": "Type of terms: vocab, grammar, kanji, or sent"
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "Page number (default: 1)",
-                        "default": 1
-                    }
-                },
-                "required": ["termtype"]
-            }
-        ),
-        
-        # ===== Vocab =====
-        Tool(
-            name="search_words",
-            description="Search the Renshuu vocabulary dictionary. You can search in Japanese (kanji, hiragana) or English.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (Japanese or English)"
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "Page number (default: 1)",
-                        "default": 1
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_word",
-            description="Get detailed information about a specific vocabulary word by its ID.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID"
-                    }
-                },
-                "required": ["word_id"]
-            }
-        ),
-        Tool(
-            name="add_word_to_schedule",
-            description="Add a vocabulary word to a study schedule. First search for the word to get its ID, then use this tool.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID to add"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID to add the word to"
-                    }
-                },
-                "required": ["word_id", "schedule_id"]
-            }
-        ),
-        Tool(
-            name="add_word_to_list",
-            description="Add a vocabulary word to a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID to add"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID to add the word to"
-                    }
-                },
-                "required": ["word_id", "list_id"]
-            }
-        ),
-        Tool(
-            name="remove_word_from_schedule",
-            description="Remove a vocabulary word from a study schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID to remove"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID to remove the word from"
-                    }
-                },
-                "required": ["word_id", "schedule_id"]
-            }
-        ),
-        Tool(
-            name="remove_word_from_list",
-            description="Remove a vocabulary word from a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID to remove"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID to remove the word from"
-                    }
-                },
-                "required": ["word_id", "list_id"]
-            }
-        ),
-        Tool(
-            name="add_word_by_schedule_name",
-            description="Add a word to a schedule by schedule name. This is a convenience tool that searches for the schedule by name, searches for the word, and adds it in a single operation. This endpoint MUST be used for add-word requests.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "schedule_name": {
-                        "type": "string",
-                        "description": "The name of the schedule to add the word to"
-                    },
-                    "word": {
-                        "type": "string",
-                        "description": "The word to search for and add (Japanese or English)"
-                    }
-                },
-                "required": ["schedule_name", "word"]
-            }
-        ),
-        
-        # ===== Kanji =====
-        Tool(
-            name="search_kanji",
-            description="Search for kanji by character or meaning.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (kanji character or English meaning)"
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_kanji",
-            description="Get detailed information about a specific kanji character.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "kanji": {
-                        "type": "string",
-                        "description": "The kanji character"
-                    }
-                },
-                "required": ["kanji"]
-            }
-        ),
-        Tool(
-            name="add_kanji_to_schedule",
-            description="Add a kanji to a study schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "kanji": {
-                        "type": "string",
-                        "description": "The kanji character to add"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    }
-                },
-                "required": ["kanji", "schedule_id"]
-            }
-        ),
-        Tool(
-            name="add_kanji_to_list",
-            description="Add a kanji to a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "kanji": {
-                        "type": "string",
-                        "description": "The kanji character to add"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID"
-                    }
-                },
-                "required": ["kanji", "list_id"]
-            }
-        ),
-        Tool(
-            name="remove_kanji_from_schedule",
-            description="Remove a kanji from a study schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "kanji": {
-                        "type": "string",
-                        "description": "The kanji character to remove"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    }
-                },
-                "required": ["kanji", "schedule_id"]
-            }
-        ),
-        Tool(
-            name="remove_kanji_from_list",
-            description="Remove a kanji from a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "kanji": {
-                        "type": "string",
-                        "description": "The kanji character to remove"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID"
-                    }
-                },
-                "required": ["kanji", "list_id"]
-            }
-        ),
-        
-        # ====== Grammar ======
-        
-        Tool(
-            name="add_grammar_to_list",
-            description="Add a grammar point to a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "grammar_id": {
-                        "type": "string",
-                        "description": "The grammar ID to add"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID"
-                    }
-                },
-                "required": ["grammar_id", "list_id"]
-            }
-        ),
-        Tool(
-            name="remove_grammar_from_schedule",
-            description="Remove a grammar point from a study schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "grammar_id": {
-                        "type": "string",
-                        "description": "The grammar ID to remove"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    }
-                },
-                "required": ["grammar_id", "schedule_id"]
-            }
-        ),
-        Tool(
-            name="remove_grammar_from_list",
-            description="Remove a grammar point from a user list.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "grammar_id": {
-                        "type": "string",
-                        "description": "The grammar ID to remove"
-                    },
-                    "list_id": {
-                        "type": "string",
-                        "description": "The list ID"
-                    }
-                },
-                "required": ["grammar_id", "list_id"]
-            }
-        ),
-        Tool(
-            name="search_grammar",
-            description="Search the grammar dictionary.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (Japanese or English)"
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "Page number (default: 1)",
-                        "default": 1
-                    }
+# Pre-built fragments of the fixed {"error": ...} envelope so error paths
+# skip the dict construction and indent machinery of _format_response
+_ERR_PREFIX = '{\n  "error": '
+_ERR_SUFFIX = '\n}'
+
+
+def _format_error(message: str) -> list[TextContent]:
+    """Format an error envelope matching _format_response's indented output."""
+    return [TextContent(type="text", text=_ERR_PREFIX + orjson.dumps(message).decode() + _ERR_SUFFIX)]
+
+
+# Shared property sub-schemas referenced across tool definitions, so identical
+# fragments are built and serialized from one object each
+_SCHEDULE_ID = {"type": "string", "description": "The schedule ID"}
+_LIST_ID = {"type": "string", "description": "The list ID"}
+_WORD_ID = {"type": "string", "description": "The word ID"}
+_KANJI = {"type": "string", "description": "The kanji character"}
+_GRAMMAR_ID = {"type": "string", "description": "The grammar ID"}
+_PAGE = {"type": "integer", "description": "Page number (default: 1)", "default": 1}
+
+# The tool list is fully static; build it once at import instead of
+# reconstructing ~30 Tool objects on every list_tools call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_profile",
+        description="Get the user's Renshuu profile: study statistics, streaks, and level progress.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_schedules",
+        description="Get all study schedules with their names, IDs, and study counts.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_schedule",
+        description="Get details of a specific schedule by ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+    Tool(
+        name="get_schedule_terms",
+        description="Get the terms (vocabulary, kanji, etc.) in a specific schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": _SCHEDULE_ID,
+                "page": _PAGE,
+                "group": {
+                    "type": "string",
+                    "description": "Filter group: all, studied, notyetstudied, review_today, etc.",
+                    "default": "all"
+                }
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+    Tool(
+        name="get_all_schedule_terms",
+        description="Get every page of terms in a schedule in one call (pages are fetched concurrently).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": _SCHEDULE_ID,
+                "group": {
+                    "type": "string",
+                    "description": "Filter group: all, studied, notyetstudied, review_today, etc.",
+                    "default": "all"
+                }
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+    Tool(
+        name="get_lists",
+        description="Get all user-created vocabulary/kanji/grammar lists.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_list",
+        description="Get contents of a specific user list by ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_id": _LIST_ID,
+                "page": _PAGE
+            },
+            "required": ["list_id"]
+        }
+    ),
+    Tool(
+        name="get_all_studied_terms",
+        description="Get all studied terms of a given type (vocab, grammar, kanji, sent).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "termtype": {
+                    "type": "string",
+                    "description": "Type of terms: vocab, grammar, kanji, or sent"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_grammar",
-            description="Get detailed information about a specific grammar point.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "grammar_id": {
-                        "type": "string",
-                        "description": "The grammar ID"
-                    }
+                "page": _PAGE
+            },
+            "required": ["termtype"]
+        }
+    ),
+    
+    # ===== Vocab =====
+    Tool(
+        name="search_words",
+        description="Search the Renshuu vocabulary dictionary in Japanese (kanji, hiragana) or English.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (Japanese or English)"
                 },
-                "required": ["grammar_id"]
-            }
-        ),
-        Tool(
-            name="add_grammar_to_schedule",
-            description="Add a grammar point to a study schedule.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "grammar_id": {
-                        "type": "string",
-                        "description": "The grammar ID to add"
-                    },
-                    "schedule_id": {
-                        "type": "string",
-                        "description": "The schedule ID"
-                    }
+                "page": _PAGE
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_word",
+        description="Get detailed information about a specific vocabulary word by its ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID
+            },
+            "required": ["word_id"]
+        }
+    ),
+    Tool(
+        name="add_word_to_schedule",
+        description="Add a vocabulary word to a study schedule by word ID (search for the word first).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["word_id", "schedule_id"]
+        }
+    ),
+    Tool(
+        name="add_word_to_list",
+        description="Add a vocabulary word to a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID,
+                "list_id": _LIST_ID
+            },
+            "required": ["word_id", "list_id"]
+        }
+    ),
+    Tool(
+        name="remove_word_from_schedule",
+        description="Remove a vocabulary word from a study schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["word_id", "schedule_id"]
+        }
+    ),
+    Tool(
+        name="remove_word_from_list",
+        description="Remove a vocabulary word from a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID,
+                "list_id": _LIST_ID
+            },
+            "required": ["word_id", "list_id"]
+        }
+    ),
+    Tool(
+        name="add_word_by_schedule_name",
+        description="Add a word to a schedule by schedule name. This is a convenience tool that searches for the schedule by name, searches for the word, and adds it in a single operation. This endpoint MUST be used for add-word requests.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_name": {
+                    "type": "string",
+                    "description": "The name of the schedule to add the word to"
                 },
-                "required": ["grammar_id", "schedule_id"]
-            }
-        ),
-        
-        # ===== Sentences =====
-        Tool(
-            name="search_sentences",
-            description="Search for example sentences in Japanese or English.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    }
+                "word": {
+                    "type": "string",
+                    "description": "The word to search for and add (Japanese or English)"
+                }
+            },
+            "required": ["schedule_name", "word"]
+        }
+    ),
+    Tool(
+        name="add_word_by_list_name",
+        description="Add a word to a list by list name. This is a convenience tool that searches for the list by name, searches for the word, and adds it in a single operation.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "list_name": {
+                    "type": "string",
+                    "description": "The name of the list to add the word to"
                 },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_sentences_for_word",
-            description="Get example sentences that use a specific vocabulary word.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "word_id": {
-                        "type": "string",
-                        "description": "The word ID"
-                    }
+                "word": {
+                    "type": "string",
+                    "description": "The word to search for and add (Japanese or English)"
+                }
+            },
+            "required": ["list_name", "word"]
+        }
+    ),
+    
+    # ===== Kanji =====
+    Tool(
+        name="search_kanji",
+        description="Search for kanji by character or meaning.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (kanji character or English meaning)"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_kanji",
+        description="Get detailed information about a specific kanji character.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kanji": _KANJI
+            },
+            "required": ["kanji"]
+        }
+    ),
+    Tool(
+        name="add_kanji_to_schedule",
+        description="Add a kanji to a study schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kanji": _KANJI,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["kanji", "schedule_id"]
+        }
+    ),
+    Tool(
+        name="add_kanji_to_list",
+        description="Add a kanji to a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kanji": _KANJI,
+                "list_id": _LIST_ID
+            },
+            "required": ["kanji", "list_id"]
+        }
+    ),
+    Tool(
+        name="remove_kanji_from_schedule",
+        description="Remove a kanji from a study schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kanji": _KANJI,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["kanji", "schedule_id"]
+        }
+    ),
+    Tool(
+        name="remove_kanji_from_list",
+        description="Remove a kanji from a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "kanji": _KANJI,
+                "list_id": _LIST_ID
+            },
+            "required": ["kanji", "list_id"]
+        }
+    ),
+    
+    # ====== Grammar ======
+    
+    Tool(
+        name="add_grammar_to_list",
+        description="Add a grammar point to a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "grammar_id": _GRAMMAR_ID,
+                "list_id": _LIST_ID
+            },
+            "required": ["grammar_id", "list_id"]
+        }
+    ),
+    Tool(
+        name="remove_grammar_from_schedule",
+        description="Remove a grammar point from a study schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "grammar_id": _GRAMMAR_ID,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["grammar_id", "schedule_id"]
+        }
+    ),
+    Tool(
+        name="remove_grammar_from_list",
+        description="Remove a grammar point from a user list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "grammar_id": _GRAMMAR_ID,
+                "list_id": _LIST_ID
+            },
+            "required": ["grammar_id", "list_id"]
+        }
+    ),
+    Tool(
+        name="search_grammar",
+        description="Search the grammar dictionary.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (Japanese or English)"
                 },
-                "required": ["word_id"]
+                "page": _PAGE
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_grammar",
+        description="Get detailed information about a specific grammar point.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "grammar_id": _GRAMMAR_ID
+            },
+            "required": ["grammar_id"]
+        }
+    ),
+    Tool(
+        name="add_grammar_to_schedule",
+        description="Add a grammar point to a study schedule.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "grammar_id": _GRAMMAR_ID,
+                "schedule_id": _SCHEDULE_ID
+            },
+            "required": ["grammar_id", "schedule_id"]
+        }
+    ),
+    
+    # ===== Sentences =====
+    Tool(
+        name="search_sentences",
+        description="Search for example sentences in Japanese or English.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_sentences_for_word",
+        description="Get example sentences that use a specific vocabulary word.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "word_id": _WORD_ID
+            },
+            "required": ["word_id"]
+        }
+    ),
+]
+
+
+# Rarely used add/remove variants are not advertised up front; clients fetch
+# their full schemas on demand through discover_tool, keeping the handshake
+# payload (and the client's prompt) small
+_DEFERRED: set[str] = {
+    "add_word_by_list_name",
+    "get_all_schedule_terms",
+    "add_word_to_schedule",
+    "add_word_to_list",
+    "remove_word_from_schedule",
+    "remove_word_from_list",
+    "add_kanji_to_schedule",
+    "add_kanji_to_list",
+    "remove_kanji_from_schedule",
+    "remove_kanji_from_list",
+    "add_grammar_to_schedule",
+    "add_grammar_to_list",
+    "remove_grammar_from_schedule",
+    "remove_grammar_from_list",
+}
+
+_TOOLS_BY_NAME: dict[str, Tool] = {t.name: t for t in _TOOLS}
+
+_DISCOVER_TOOL = Tool(
+    name="discover_tool",
+    description=(
+        "Get the full schema of a tool that is not listed up front. "
+        "Available: " + ", ".join(sorted(_DEFERRED)) + ". "
+        "Discovered tools can then be called directly by name."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "Name of the tool to describe"
             }
-        ),
-    ]
+        },
+        "required": ["name"]
+    }
+)
+
+_CORE_TOOLS: list[Tool] = [t for t in _TOOLS if t.name not in _DEFERRED] + [_DISCOVER_TOOL]
+
+# Compiled once per tool; validator construction dominates validation cost
+# for inputs this small
+_VALIDATORS: dict[str, Draft7Validator] = {
+    t.name: Draft7Validator(t.inputSchema) for t in _TOOLS + [_DISCOVER_TOOL]
+}
+
 
+async def _discover_tool(name: str) -> dict[str, Any]:
+    """Return the full definition of a deferred tool."""
+    tool = _TOOLS_BY_NAME.get(name)
+    if tool is None:
+        return {
+            "error": f"Unknown tool: {name}",
+            "deferred_tools": sorted(_DEFERRED)
+        }
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "inputSchema": tool.inputSchema
+    }
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
     """
-    Function that executes the tool calls
+    Endpoint that provides the list of tools for the MCP client.
     """
-    global client
+    return _CORE_TOOLS
 
-    if client is None:
-        return _format_response({"error": "Client not initialized."})
-    
-    try:
-        # ===== User & Lists =====
-        if name == "get_profile":
-            result = await client.get_profile()
-        elif name == "get_schedules":
-            result = await client.get_schedules()
-        elif name == "get_schedule":
-            result = await client.get_schedule(arguments["schedule_id"])
-        elif name == "get_schedule_terms":
-            result = await client.get_schedule_terms(
-                arguments["schedule_id"],
-                pg=arguments.get("page", 1),
-                group=arguments.get("group", "all")
-            )
-        elif name == "get_lists":
-            result = await client.get_lists()
-        elif name == "get_list":
-            result = await client.get_list(
-                arguments["list_id"],
-                pg=arguments.get("page", 1)
-            )
-        elif name == "get_all_studied_terms":
-            result = await client.get_all_studied_terms(
-                arguments["termtype"],
-                pg=arguments.get("page", 1)
-            )
-
-        # ===== Vocab =====
-        elif name == "search_words":
-            result = await client.search_words(
-                arguments["query"],
-                pg=arguments.get("page", 1)
-            )
-        elif name == "get_word":
-            result = await client.get_word(arguments["word_id"])
-        elif name == "add_word_to_schedule":
-            result = await client.add_word_to_schedule(
-                arguments["word_id"],
-                arguments["schedule_id"]
-            )
-        elif name == "add_word_to_list":
-            result = await client.add_word_to_list(
-                arguments["word_id"],
-                arguments["list_id"]
-            )
-        elif name == "remove_word_from_schedule":
-            result = await client.remove_word_from_schedule(
-                arguments["word_id"],
-                arguments["schedule_id"]
-            )
-        elif name == "remove_word_from_list":
-            result = await client.remove_word_from_list(
-                arguments["word_id"],
-                arguments["list_id"]
-            )
-        elif name == "add_word_by_schedule_name":
-            result = await client.add_word_by_schedule_name(
-                arguments["schedule_name"],
-                arguments["word"]
-            )
-        elif name == "add_word_by_list_name":
-            result = await client.add_word_by_list_name(
-                arguments["list_name"],
-                arguments["word"]
-            )
-
-        # ===== Kanji =====
-        elif name == "search_kanji":
-            result = await client.search_kanji(arguments["query"])
-        elif name == "get_kanji":
-            result = await client.get_kanji(arguments["kanji"])
-        elif name == "add_kanji_to_schedule":
-            result = await client.add_kanji_to_schedule(
-                arguments["kanji"],
-                arguments["schedule_id"]
-            )
-        elif name == "add_kanji_to_list":
-            result = await client.add_kanji_to_list(
-                arguments["kanji"],
-                arguments["list_id"]
-            )
-        elif name == "remove_kanji_from_schedule":
-            result = await client.remove_kanji_from_schedule(
-                arguments["kanji"],
-                arguments["schedule_id"]
-            )
-        elif name == "remove_kanji_from_list":
-            result = await client.remove_kanji_from_list(
-                arguments["kanji"],
-                arguments["list_id"]
-            )
-
-        # ===== Grammar =====
-        elif name == "search_grammar":
-            result = await client.search_grammar(
-                arguments["query"],
-                pg=arguments.get("page", 1)
-            )
-        elif name == "get_grammar":
-            result = await client.get_grammar(arguments["grammar_id"])
-        elif name == "add_grammar_to_schedule":
-            result = await client.add_grammar_to_schedule(
-                arguments["grammar_id"],
-                arguments["schedule_id"]
-            )
-        elif name == "add_grammar_to_list":
-            result = await client.add_grammar_to_list(
-                arguments["grammar_id"],
-                arguments["list_id"]
-            )
-        elif name == "remove_grammar_from_schedule":
-            result = await client.remove_grammar_from_schedule(
-                arguments["grammar_id"],
-                arguments["schedule_id"]
-            )
-        elif name == "remove_grammar_from_list":
-            result = await client.remove_grammar_from_list(
-                arguments["grammar_id"],
-                arguments["list_id"]
-            )
-
-        # ===== Sentences =====
-        elif name == "search_sentences":
-            result = await client.search_sentences(arguments["query"])
-        elif name == "get_sentences_for_word":
-            result = await client.get_sentences_for_word(arguments["word_id"])
-        else:
-            result = {"error": f"Unknown tool: {name}"}
-
-        return _format_response(result)
-    except Exception as exc:
-        logger.exception(f"Error calling tool {name}")
-        return _format_response({"error": str(exc)})
+
+# Declarative call signatures: tool name -> (client method, required
+# arguments, ((argument, keyword, default), ...)). Single source of truth
+# the dispatch adapters are generated from.
+_SPEC: dict[str, tuple[str, tuple[str, ...], tuple[tuple[str, str, Any], ...]]] = {
+    # ===== User & Lists =====
+    "get_profile": ("get_profile", (), ()),
+    "get_schedules": ("get_schedules", (), ()),
+    "get_schedule": ("get_schedule", ("schedule_id",), ()),
+    "get_schedule_terms": ("get_schedule_terms", ("schedule_id",), (("page", "pg", 1), ("group", "group", "all"))),
+    "get_all_schedule_terms": ("get_all_schedule_terms", ("schedule_id",), (("group", "group", "all"),)),
+    "get_lists": ("get_lists", (), ()),
+    "get_list": ("get_list", ("list_id",), (("page", "pg", 1),)),
+    "get_all_studied_terms": ("get_all_studied_terms", ("termtype",), (("page", "pg", 1),)),
+
+    # ===== Vocab =====
+    "search_words": ("search_words", ("query",), (("page", "pg", 1),)),
+    "get_word": ("get_word", ("word_id",), ()),
+    "add_word_to_schedule": ("add_word_to_schedule", ("word_id", "schedule_id"), ()),
+    "add_word_to_list": ("add_word_to_list", ("word_id", "list_id"), ()),
+    "remove_word_from_schedule": ("remove_word_from_schedule", ("word_id", "schedule_id"), ()),
+    "remove_word_from_list": ("remove_word_from_list", ("word_id", "list_id"), ()),
+    "add_word_by_schedule_name": ("add_word_by_schedule_name", ("schedule_name", "word"), ()),
+    "add_word_by_list_name": ("add_word_by_list_name", ("list_name", "word"), ()),
+
+    # ===== Kanji =====
+    "search_kanji": ("search_kanji", ("query",), ()),
+    "get_kanji": ("get_kanji", ("kanji",), ()),
+    "add_kanji_to_schedule": ("add_kanji_to_schedule", ("kanji", "schedule_id"), ()),
+    "add_kanji_to_list": ("add_kanji_to_list", ("kanji", "list_id"), ()),
+    "remove_kanji_from_schedule": ("remove_kanji_from_schedule", ("kanji", "schedule_id"), ()),
+    "remove_kanji_from_list": ("remove_kanji_from_list", ("kanji", "list_id"), ()),
+
+    # ===== Grammar =====
+    "search_grammar": ("search_grammar", ("query",), (("page", "pg", 1),)),
+    "get_grammar": ("get_grammar", ("grammar_id",), ()),
+    "add_grammar_to_schedule": ("add_grammar_to_schedule", ("grammar_id", "schedule_id"), ()),
+    "add_grammar_to_list": ("add_grammar_to_list", ("grammar_id", "list_id"), ()),
+    "remove_grammar_from_schedule": ("remove_grammar_from_schedule", ("grammar_id", "schedule_id"), ()),
+    "remove_grammar_from_list": ("remove_grammar_from_list", ("grammar_id", "list_id"), ()),
+
+    # ===== Sentences =====
+    "search_sentences": ("search_sentences", ("query",), ()),
+    "get_sentences_for_word": ("get_sentences_for_word", ("word_id",), ()),
+}
+
+
+def _make_adapter(
+    method: str,
+    required: tuple[str, ...],
+    optional: tuple[tuple[str, str, Any], ...]
+) -> Callable[[RenshuuClient, dict[str, Any]], Awaitable[dict[str, Any]]]:
+    """Synthesize a dispatch adapter with the call signature baked into its closure."""
+    async def adapter(c: RenshuuClient, a: dict[str, Any]) -> dict[str, Any]:
+        get = a.get
+        return await getattr(c, method)(
+            *[a[r] for r in required],
+            **{kw: get(arg, default) for arg, kw, default in optional}
+        )
+    return adapter
+
+
+# O(1) dispatch table mapping tool names to adapters that unpack the
+# arguments dict and await the matching client method
+# Keys are interned so lookups on interned inbound names hit CPython's
+# pointer-identity fast path before falling back to full string compares
+_DISPATCH: dict[str, Callable[[RenshuuClient, dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+    sys.intern(name): _make_adapter(*spec) for name, spec in _SPEC.items()
+}
+_DISPATCH[sys.intern("discover_tool")] = lambda c, a: _discover_tool(a["name"])
+
+
+# Short-TTL response cache for the read-only no-arg tools, which LLM clients
+# tend to re-fetch every turn. Stale entries are served while a background
+# task refreshes them; any mutating tool call clears the cache.
+_CACHEABLE_TOOLS = frozenset({"get_profile", "get_schedules", "get_lists"})
+_MUTATING_PREFIXES = ("add_", "remove_")
+_CACHE_TTL = 60.0
+_response_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Strong references to in-flight refresh tasks, keyed by tool name; keeps the
+# tasks alive until done and ensures only one refresh per key runs at a time
+_refresh_tasks: dict[str, asyncio.Task] = {}
+
+
+async def _cached_call(
+    name: str,
+    handler: Callable[[RenshuuClient, dict[str, Any]], Awaitable[dict[str, Any]]],
+    client: RenshuuClient,
+    arguments: dict[str, Any]
+) -> dict[str, Any]:
+    """Serve a cached response, refreshing expired entries in the background."""
+    entry = _response_cache.get(name)
+    if entry is not None:
+        ts, value = entry
+        if time.monotonic() - ts >= _CACHE_TTL and name not in _refresh_tasks:
+            async def _refresh() -> None:
+                try:
+                    _response_cache[name] = (time.monotonic(), await handler(client, arguments))
+                except Exception:
+                    _response_cache.pop(name, None)
+            task = asyncio.create_task(_refresh())
+            _refresh_tasks[name] = task
+            task.add_done_callback(lambda _, name=name: _refresh_tasks.pop(name, None))
+        return value
+
+    result = await handler(client, arguments)
+    _response_cache[name] = (time.monotonic(), result)
+    return result
+
+
+def _bind_call_tool(client: RenshuuClient) -> None:
+    """
+    Register the call_tool handler with the client captured in its closure,
+    so the hot path carries no global lookup or initialization check.
+    """
+    # The SDK's own validation recompiles each schema per call and can't see
+    # the deferred tools; the cached _VALIDATORS below cover both, once
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        """
+        Function that executes the tool calls
+        """
+        # Tool names arrive as fresh strings from JSON; interning makes the
+        # dict probe a pointer comparison for repeated calls
+        name = sys.intern(name)
+        handler = _DISPATCH.get(name)
+        if handler is None:
+            return _format_error(f"Unknown tool: {name}")
+
+        try:
+            _VALIDATORS[name].validate(arguments)
+        except ValidationError as exc:
+            return _format_error(f"Invalid arguments for {name}: {exc.message}")
+
+        try:
+            if name in _CACHEABLE_TOOLS:
+                result = await _cached_call(name, handler, client, arguments)
+            else:
+                result = await handler(client, arguments)
+                if name.startswith(_MUTATING_PREFIXES):
+                    _response_cache.clear()
+            return _format_response(result)
+        except Exception as exc:
+            logger.exception("Error calling tool %s", name)
+            return _format_error(str(exc))
 
 
 async def main() -> None:
     """
     Entrypoint for the MCP server.
-    """
-    global client
 
+    The `async with` below is the sole lifecycle boundary for the HTTP
+    client: every tool call shares this one RenshuuClient and its
+    keep-alive connection pool for the life of the process.
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(_log_queue))
+    # Deferred tools are intentionally absent from list_tools, and the SDK
+    # warns "Tool '...' not listed, no validation will be performed" on every
+    # call to one; our own validators cover them, so silence that warning
+    logging.getLogger("mcp.server.lowlevel.server").setLevel(logging.ERROR)
+    listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    listener.start()
     logger.info("Starting renshuu MCP server")
-    async with RenshuuClient() as c:
-        client = c
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream,
-                write_stream,
-                server.create_initialization_options(),
-            )
+    try:
+        async with RenshuuClient() as c:
+            _bind_call_tool(c)
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())